@@ -1,7 +1,7 @@
 # imports
 import os
 from dotenv import load_dotenv
-from flask import Flask, jsonify, request, session, render_template, redirect, url_for, flash
+from flask import Flask, jsonify, request, session, render_template, redirect, url_for, flash, send_from_directory, abort
 from flask_sqlalchemy import SQLAlchemy
 import bcrypt
 from flask_migrate import Migrate
@@ -14,6 +14,9 @@ from flask_mail import Mail, Message
 from itsdangerous import URLSafeTimedSerializer
 from logging.handlers import RotatingFileHandler 
 import random
+import json
+import mimetypes
+import math
 
 
 """
@@ -55,12 +58,40 @@ app.config["SQLALCHEMY_DATABASE_URI"] = os.getenv(
 
 
 # Initialize database
+# the schema is managed by the migrations in migrations/versions: flask --app app db upgrade
 db.init_app(app)
 migrate = Migrate(app, db)
 
+# Static assets
+# build_assets.py writes minified, fingerprinted and precompressed files to static/dist
+# along with a manifest mapping "script.js" -> "script.<hash>.js"
+ASSET_DIR = os.path.join(app.static_folder, "dist")
+ASSET_CACHE_CONTROL = "public, max-age=31536000, immutable"  # hashed names never change content
 
-with app.app_context():
-    db.create_all()
+
+def load_asset_manifest():
+    """Reads the asset manifest. Returns an empty dict if assets haven't been built."""
+    try:
+        with open(os.path.join(ASSET_DIR, "manifest.json"), encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+asset_manifest = load_asset_manifest()
+
+
+def asset_url(filename):
+    """URL for a static file, using the fingerprinted build when there is one"""
+    hashed_name = asset_manifest.get(filename)
+    if hashed_name:
+        return url_for("serve_asset", filename=hashed_name)
+    # not built (local development) -> fall back to the plain static file
+    return url_for("static", filename=filename)
+
+
+# lets templates call {{ asset_url('styles.css') }}
+app.jinja_env.globals["asset_url"] = asset_url
 
 # Logging 
 # configure log file rotation
@@ -275,7 +306,8 @@ def employee_login():
         print(f"🔍 Debug: Attempting login for {username}")  # Debugging
 
         # Find the employee
-        employee = Employee.query.filter(Employee.username.ilike(username)).first()
+        # case-insensitive match, served by the lower(username) index
+        employee = Employee.query.filter(db.func.lower(Employee.username) == (username or "").lower()).first()
 
         if not employee:
             print("⚠ Debug: Employee not found!")
@@ -461,7 +493,120 @@ def delete_employee(employee_id):
     except Exception as e:
         db.session.rollback()
         return jsonify({"error":f"Failed to delete employee: {str(e)}"}), 500
-    
+
+
+# most employee ids one bulk request may touch
+MAX_BULK_IDS = 1000
+
+# reads and validates the list of employee ids sent to the bulk endpoints
+def get_bulk_employee_ids(data):
+    ids = data.get("ids") if isinstance(data, dict) else None
+    if not isinstance(ids, list) or not ids:
+        raise ValueError("A non-empty list of employee ids is required.")
+    if len(ids) > MAX_BULK_IDS:
+        raise ValueError(f"At most {MAX_BULK_IDS} employees can be changed in one request.")
+    if not all(isinstance(employee_id, int) and not isinstance(employee_id, bool) for employee_id in ids):
+        raise ValueError("Employee ids must be integers.")
+    return set(ids)
+
+
+# Bulk delete employees (one DELETE ... WHERE id IN (...) statement)
+@app.route('/employees/bulk/remove', methods=['DELETE'])
+@login_required
+def bulk_delete_employees():
+    try:
+        ids = get_bulk_employee_ids(request.get_json(silent=True))
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    try:
+        result = db.session.execute(
+            db.delete(Employee)
+            .where(Employee.id.in_(ids))
+            .execution_options(synchronize_session=False)
+        )
+        db.session.commit()
+        logging.info(f"Bulk removed {result.rowcount} of {len(ids)} requested employees.")
+        return jsonify({"message": f"{result.rowcount} employees deleted successfully.", "deleted": result.rowcount}), 200
+    except Exception as e:
+        db.session.rollback()
+        logging.error(f"Error bulk removing {len(ids)} employees: {str(e)}")
+        return jsonify({"error": f"Failed to delete employees: {str(e)}"}), 500
+
+
+# Bulk update employees (one UPDATE ... WHERE id IN (...) statement)
+# supports setting a new title and/or applying a salary raise percentage
+@app.route('/employees/bulk/edit', methods=['PUT'])
+@login_required
+def bulk_update_employees():
+    data = request.get_json(silent=True)
+    try:
+        ids = get_bulk_employee_ids(data)
+
+        values = {}
+        title = data.get("title")
+        if title is not None:
+            if not isinstance(title, str):
+                raise ValueError("Title must be a string.")
+            title = title.strip()
+            if not title:
+                raise ValueError("Title cannot be empty.")
+            if len(title) > Employee.title.type.length:
+                raise ValueError(f"Title cannot be longer than {Employee.title.type.length} characters.")
+            values[Employee.title] = title
+
+        raise_percent = data.get("salary_raise_percent")
+        if raise_percent is not None:
+            if not isinstance(raise_percent, (int, float)) or isinstance(raise_percent, bool):
+                raise ValueError("Salary raise percentage must be a number.")
+            if not math.isfinite(raise_percent) or raise_percent <= -100:
+                raise ValueError("Salary raise percentage must be a number greater than -100.")
+            # computed in SQL so every row is updated by the same statement
+            values[Employee.salary] = Employee.salary * (1 + raise_percent / 100)
+
+        if not values:
+            raise ValueError("Nothing to update. Provide a title and/or salary_raise_percent.")
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    try:
+        result = db.session.execute(
+            db.update(Employee)
+            .where(Employee.id.in_(ids))
+            .values(values)
+            .execution_options(synchronize_session=False)
+        )
+        db.session.commit()
+        logging.info(f"Bulk updated {result.rowcount} of {len(ids)} requested employees.")
+        return jsonify({"message": f"{result.rowcount} employees updated successfully.", "updated": result.rowcount}), 200
+    except Exception as e:
+        db.session.rollback()
+        logging.error(f"Error bulk updating {len(ids)} employees: {str(e)}")
+        return jsonify({"error": "Employee update failed", "details": str(e)}), 500
+
+# fingerprinted static assets
+@app.route('/assets/<path:filename>')
+def serve_asset(filename):
+    """Serves built assets, preferring a precompressed copy the client accepts"""
+    # only fingerprinted files are safe to cache forever (not e.g. manifest.json)
+    if filename not in asset_manifest.values():
+        abort(404)
+
+    mimetype = mimetypes.guess_type(filename)[0]
+    response = None
+    for encoding, suffix in (("br", ".br"), ("gzip", ".gz")):
+        # quality 0 ("br;q=0") means the client refuses that encoding
+        if request.accept_encodings[encoding] > 0 and os.path.isfile(os.path.join(ASSET_DIR, filename + suffix)):
+            response = send_from_directory(ASSET_DIR, filename + suffix, mimetype=mimetype)
+            response.headers["Content-Encoding"] = encoding
+            break
+    if response is None:
+        response = send_from_directory(ASSET_DIR, filename, mimetype=mimetype)
+
+    response.headers["Cache-Control"] = ASSET_CACHE_CONTROL
+    response.vary.add("Accept-Encoding")
+    return response
+
 # data visualization
 @app.route('/admin/dashboard')
 def admin_dashboard():
@@ -0,0 +1,204 @@
+"""
+Static asset build step for the Employee Management System.
+
+Run this before starting the app (the Procfile does it for us):
+
+    python build_assets.py
+
+For every file listed in ASSETS it will:
+- minify the source (vendored third party files are already minified and copied as-is)
+- fingerprint the filename with a hash of its contents (script.js -> script.1a2b3c4d5e.js)
+- write precompressed .gz and .br siblings next to it (.br only if `brotli` is installed)
+- record the mapping in static/dist/manifest.json
+
+app.py reads the manifest so templates can call `asset_url("script.js")` and get the
+hashed URL. Because the filename changes whenever the content does, the files can be
+served with a long-lived immutable Cache-Control header.
+
+Chart.js is vendored (committed) under static/vendor/ so the admin dashboard works
+offline. To restore or re-download it, `python build_assets.py --fetch-vendor` fetches
+the pinned version and checks it against the recorded SHA-256.
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import re
+import shutil
+import sys
+import tempfile
+import urllib.request
+
+try:
+    import brotli
+except ImportError:  # brotli is optional, we still ship gzip
+    brotli = None
+
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+STATIC_DIR = os.path.join(BASE_DIR, "static")
+DIST_DIR = os.path.join(STATIC_DIR, "dist")
+MANIFEST_NAME = "manifest.json"
+
+# source files (relative to static/) that go through the pipeline
+ASSETS = [
+    "styles.css",
+    "script.js",
+    "vendor/chart.umd.min.js",
+]
+
+# third party files we keep a local copy of, pinned to an exact version and content hash
+# (filename -> (url, sha256)). A download whose hash doesn't match is rejected.
+CHART_JS_VERSION = "4.5.1"
+CHART_JS_URL = f"https://cdn.jsdelivr.net/npm/chart.js@{CHART_JS_VERSION}/dist/chart.umd.min.js"
+CHART_JS_SHA256 = "48444a82d4edcb5bec0f1965faacdde18d9c17db3063d042abada2f705c9f54a"
+VENDOR_SOURCES = {
+    "vendor/chart.umd.min.js": (CHART_JS_URL, CHART_JS_SHA256),
+}
+
+HASH_LENGTH = 10
+
+
+# ----------Minifiers-----------
+
+# comments, quoted strings and url(...) values; strings and urls are copied untouched
+CSS_TOKEN = re.compile(r"""(/\*.*?\*/|"(?:\\.|[^"\\])*"|'(?:\\.|[^'\\])*'|url\([^)]*\))""", re.S)
+
+
+def minify_css_code(code):
+    """Collapses whitespace in CSS code that contains no strings or comments."""
+    code = re.sub(r"\s+", " ", code)
+    # spaces around punctuation never matter in CSS (a space before ':' can, so keep it)
+    code = re.sub(r"\s*([{};,>])\s*", r"\1", code)
+    code = re.sub(r":\s+", ":", code)
+    return code.replace(";}", "}")
+
+
+def minify_css(source):
+    """Strips comments and collapses whitespace in a stylesheet, leaving strings and urls alone."""
+    output = []
+    code = ""
+    for i, part in enumerate(CSS_TOKEN.split(source)):
+        if i % 2 == 0:
+            code += part
+        elif not part.startswith("/*"):
+            output.append(minify_css_code(code))
+            output.append(part)
+            code = ""
+    output.append(minify_css_code(code))
+    return "".join(output).strip()
+
+
+def minify_js(source):
+    """
+    Conservative JS minifier: drops blank lines, comment-only lines and indentation.
+
+    It never rewrites code inside a line, so it can't break strings or regex literals.
+    Lines inside a multi-line template literal are kept exactly as they are.
+    """
+    lines = []
+    in_template = False
+    for line in source.splitlines():
+        if in_template:
+            lines.append(line)
+        else:
+            stripped = line.strip()
+            if not stripped or stripped.startswith("//"):
+                continue
+            lines.append(stripped)
+        # an odd number of unescaped backticks opens or closes a template literal
+        if len(re.findall(r"(?<!\\)`", line)) % 2:
+            in_template = not in_template
+    return "\n".join(lines) + "\n"
+
+
+def minify(filename, source):
+    # vendored bundles ship minified already
+    if filename.startswith("vendor/") or ".min." in filename:
+        return source
+    if filename.endswith(".css"):
+        return minify_css(source)
+    if filename.endswith(".js"):
+        return minify_js(source)
+    return source
+
+
+# ----------Build steps-----------
+
+def fingerprint(filename, content):
+    """Returns filename with a content hash inserted before the extension."""
+    digest = hashlib.sha256(content).hexdigest()[:HASH_LENGTH]
+    root, ext = os.path.splitext(filename)
+    return f"{root}.{digest}{ext}"
+
+
+def write_compressed(path, content):
+    """Writes .gz (and .br when available) copies of content next to path."""
+    # mtime=0 keeps the gzip output identical between builds
+    with open(path + ".gz", "wb") as f:
+        f.write(gzip.compress(content, compresslevel=9, mtime=0))
+    if brotli is not None:
+        with open(path + ".br", "wb") as f:
+            f.write(brotli.compress(content, quality=11))
+
+
+def fetch_vendor_files():
+    """Downloads any missing vendored third party files and verifies their SHA-256."""
+    for filename, (url, expected_sha256) in VENDOR_SOURCES.items():
+        path = os.path.join(STATIC_DIR, filename)
+        if os.path.exists(path):
+            continue
+        print(f"Downloading {url}")
+        with urllib.request.urlopen(url) as response:
+            content = response.read()
+
+        actual_sha256 = hashlib.sha256(content).hexdigest()
+        if expected_sha256 is None:
+            raise SystemExit(f"No SHA-256 pinned for static/{filename}. Downloaded file hashes to "
+                             f"{actual_sha256}; verify it against upstream and record it in VENDOR_SOURCES.")
+        if actual_sha256 != expected_sha256:
+            raise SystemExit(f"SHA-256 mismatch for {url}: expected {expected_sha256}, got {actual_sha256}")
+
+        # write to a temp file first so a failed write never leaves a partial vendor file
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with tempfile.NamedTemporaryFile(dir=os.path.dirname(path), delete=False) as f:
+            f.write(content)
+        os.replace(f.name, path)
+        print(f"Saved static/{filename}")
+
+
+def build(static_dir=STATIC_DIR, dist_dir=DIST_DIR, assets=ASSETS):
+    """Builds every asset into dist_dir and returns the manifest."""
+    if os.path.isdir(dist_dir):
+        shutil.rmtree(dist_dir)
+    os.makedirs(dist_dir)
+
+    manifest = {}
+    for filename in assets:
+        source_path = os.path.join(static_dir, filename)
+        if not os.path.exists(source_path):
+            raise FileNotFoundError(f"Asset static/{filename} listed in ASSETS does not exist")
+
+        with open(source_path, encoding="utf-8") as f:
+            content = minify(filename, f.read()).encode("utf-8")
+
+        hashed_name = fingerprint(filename, content)
+        output_path = os.path.join(dist_dir, hashed_name)
+        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+        with open(output_path, "wb") as f:
+            f.write(content)
+        write_compressed(output_path, content)
+
+        manifest[filename] = hashed_name
+        print(f"Built static/{filename} -> {hashed_name}")
+
+    with open(os.path.join(dist_dir, MANIFEST_NAME), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    return manifest
+
+
+if __name__ == "__main__":
+    if "--fetch-vendor" in sys.argv:
+        fetch_vendor_files()
+    build()
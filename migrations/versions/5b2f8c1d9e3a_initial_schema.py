@@ -0,0 +1,49 @@
+"""initial schema
+
+Revision ID: 5b2f8c1d9e3a
+Revises:
+Create Date: 2026-10-19 10:00:00.000000
+
+Tables as they were created by db.create_all() before migrations existed.
+A database that create_all() already built should be marked as being at this
+revision with `flask --app app db stamp 5b2f8c1d9e3a` and then upgraded.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5b2f8c1d9e3a'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('users',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('username', sa.String(length=50), nullable=False),
+    sa.Column('password_hash', sa.String(length=128), nullable=False),
+    sa.Column('is_admin', sa.Boolean(), nullable=True),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('username')
+    )
+    op.create_table('employees',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('first_name', sa.String(length=50), nullable=False),
+    sa.Column('last_name', sa.String(length=50), nullable=False),
+    sa.Column('email', sa.String(length=100), nullable=False),
+    sa.Column('salary', sa.Float(), nullable=True),
+    sa.Column('start_date', sa.Date(), nullable=True),
+    sa.Column('title', sa.String(length=50), nullable=True),
+    sa.Column('username', sa.String(length=50), nullable=True),
+    sa.Column('password_hash', sa.String(length=128), nullable=True),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('email'),
+    sa.UniqueConstraint('username')
+    )
+
+
+def downgrade():
+    op.drop_table('employees')
+    op.drop_table('users')
@@ -0,0 +1,34 @@
+"""add access pattern indexes
+
+Revision ID: 9c4a7e2b6f10
+Revises: 5b2f8c1d9e3a
+Create Date: 2026-10-19 10:05:00.000000
+
+Indexes for how the tables are actually queried: employees by title, start date
+and name, and users by is_admin (first admin check on startup).
+if_not_exists covers databases stamped at the initial revision whose tables were
+built by create_all() from models that already declared these indexes.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9c4a7e2b6f10'
+down_revision = '5b2f8c1d9e3a'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index('ix_employees_title', 'employees', ['title'], unique=False, if_not_exists=True)
+    op.create_index('ix_employees_start_date', 'employees', ['start_date'], unique=False, if_not_exists=True)
+    op.create_index('ix_employees_last_name_first_name', 'employees', ['last_name', 'first_name'], unique=False, if_not_exists=True)
+    op.create_index('ix_users_is_admin', 'users', ['is_admin'], unique=False, if_not_exists=True)
+
+
+def downgrade():
+    op.drop_index('ix_users_is_admin', table_name='users', if_exists=True)
+    op.drop_index('ix_employees_last_name_first_name', table_name='employees', if_exists=True)
+    op.drop_index('ix_employees_start_date', table_name='employees', if_exists=True)
+    op.drop_index('ix_employees_title', table_name='employees', if_exists=True)
@@ -0,0 +1,26 @@
+"""add lower(username) index
+
+Revision ID: d3b8f5a1c2e7
+Revises: 9c4a7e2b6f10
+Create Date: 2026-10-19 12:00:00.000000
+
+Employee login matches usernames case-insensitively with lower(username) = ?,
+which a plain index on username can't serve.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd3b8f5a1c2e7'
+down_revision = '9c4a7e2b6f10'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index('ix_employees_lower_username', 'employees', [sa.text('lower(username)')], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_employees_lower_username', table_name='employees')
@@ -12,7 +12,7 @@ class User(db.Model):
     id = db.Column(db.Integer, primary_key=True, autoincrement=True)
     username = db.Column(db.String(50), unique=True, nullable=False)
     password_hash = db.Column(db.String(128), nullable=False)
-    is_admin = db.Column(db.Boolean, default=False)
+    is_admin = db.Column(db.Boolean, default=False, index=True)  # looked up when creating the first admin
 
     def set_password(self, password):
         """Hashes and sets the password."""
@@ -26,14 +26,18 @@ class User(db.Model):
 # Employee Model (For Employees)
 class Employee(db.Model):
     __tablename__ = "employees"
+    __table_args__ = (
+        # lookups and sorting by name (last name first)
+        db.Index("ix_employees_last_name_first_name", "last_name", "first_name"),
+    )
     
     id = db.Column(db.Integer, primary_key=True, autoincrement=True)
     first_name = db.Column(db.String(50), nullable=False)
     last_name = db.Column(db.String(50), nullable=False)
     email = db.Column(db.String(100), unique=True, nullable=False)
     salary = db.Column(db.Float, nullable=True)
-    start_date = db.Column(db.Date, nullable=True)
-    title = db.Column(db.String(50), nullable=True)
+    start_date = db.Column(db.Date, nullable=True, index=True)
+    title = db.Column(db.String(50), nullable=True, index=True)
     username = db.Column(db.String(50), unique=True, nullable=True)
     password_hash = db.Column(db.String(128), nullable=True)
 
@@ -57,3 +61,7 @@ class Employee(db.Model):
             "title": self.title,
             "username": self.username 
         }
+
+
+# case-insensitive username lookups at employee login: lower(username) = ?
+db.Index("ix_employees_lower_username", db.func.lower(Employee.username))
@@ -69,3 +69,110 @@ async function deleteEmployee(employeeId) {
     }
 }
 
+// ----------Bulk operations-----------
+
+// returns the ids of every checked employee row
+function getSelectedEmployeeIds() {
+    return Array.from(document.querySelectorAll(".employee-select:checked"))
+        .map(checkbox => parseInt(checkbox.value, 10));
+}
+
+// checks or unchecks every employee row
+function toggleAllEmployees(checked) {
+    document.querySelectorAll(".employee-select").forEach(checkbox => {
+        checkbox.checked = checked;
+    });
+}
+
+// function to delete all selected employees with a single request
+async function bulkDeleteEmployees() {
+    const ids = getSelectedEmployeeIds();
+    if (ids.length === 0) {
+        alert("Select at least one employee.");
+        return;
+    }
+    if (!confirm(`Are you sure you want to delete ${ids.length} employee(s)?`)) {
+        return;
+    }
+    try {
+        const response = await fetch("/employees/bulk/remove", {
+            method: "DELETE",
+            headers: { "Content-Type": "application/json" },
+            body: JSON.stringify({ ids: ids }),
+        });
+
+        const result = await response.json();
+
+        if (!response.ok) {
+            alert(`Error: ${result.error || "Failed to delete employees."}`);
+            return;
+        }
+
+        alert(result.message);
+
+        // Remove the deleted rows from the table dynamically
+        ids.forEach(employeeId => {
+            const row = document.getElementById(`employee-${employeeId}`);
+            if (row) row.remove();
+        });
+        document.getElementById("select-all-employees").checked = false;
+    } catch (err) {
+        console.error("Error:", err);
+        alert("An unexpected error occurred.");
+    }
+}
+
+// sets the title typed in the bulk actions bar on all selected employees
+function bulkSetTitle() {
+    const title = document.getElementById("bulk-title").value.trim();
+    if (!title) {
+        alert("Enter a title.");
+        return;
+    }
+    bulkUpdateEmployees({ title: title });
+}
+
+// applies the raise percentage typed in the bulk actions bar to all selected employees
+function bulkApplyRaise() {
+    const input = document.getElementById("bulk-raise").value;
+    const percent = Number(input);
+    if (input.trim() === "" || !Number.isFinite(percent)) {
+        alert("Enter a raise percentage, e.g. 5 or -2.5.");
+        return;
+    }
+    if (percent <= -100) {
+        alert("The raise percentage must be greater than -100.");
+        return;
+    }
+    bulkUpdateEmployees({ salary_raise_percent: percent });
+}
+
+// function to apply the same change (e.g. { title: "Engineer" } or { salary_raise_percent: 5 })
+// to all selected employees with a single request
+async function bulkUpdateEmployees(changes) {
+    const ids = getSelectedEmployeeIds();
+    if (ids.length === 0) {
+        alert("Select at least one employee.");
+        return;
+    }
+    try {
+        const response = await fetch("/employees/bulk/edit", {
+            method: "PUT",
+            headers: { "Content-Type": "application/json" },
+            body: JSON.stringify({ ids: ids, ...changes }),
+        });
+
+        const result = await response.json();
+
+        if (!response.ok) {
+            alert(result.error || "Failed to update employees.");
+            return;
+        }
+
+        alert(result.message);
+        window.location.reload(); // show the updated values
+    } catch (err) {
+        console.error("Error:", err);
+        alert("An unexpected error occurred.");
+    }
+}
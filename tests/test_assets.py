@@ -0,0 +1,112 @@
+import pytest
+import sys
+import os
+import gzip
+import hashlib
+
+# Add the project root to sys.path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import app as ems
+import build_assets
+
+@pytest.fixture
+def built_assets(tmp_path, monkeypatch):
+    static_dir = tmp_path / "static"
+    static_dir.mkdir()
+    (static_dir / "styles.css").write_text("/* comment */\nbody {\n    color: red;\n}\n")
+    (static_dir / "script.js").write_text("// comment\nfunction hi() {\n    return `a\n    b`;\n}\n")
+
+    dist_dir = tmp_path / "dist"
+    manifest = build_assets.build(str(static_dir), str(dist_dir), ["styles.css", "script.js"])
+
+    monkeypatch.setattr(ems, "ASSET_DIR", str(dist_dir))
+    monkeypatch.setattr(ems, "asset_manifest", manifest)
+    return dist_dir, manifest
+
+@pytest.fixture
+def client():
+    ems.app.config['TESTING'] = True
+    with ems.app.app_context():
+        ems.db.create_all()
+    with ems.app.test_client() as client:
+        yield client
+
+def test_minify_css():
+    assert build_assets.minify_css("/* x */ a , b {\n  color : red;\n}") == "a,b{color :red}"
+
+def test_minify_js_keeps_template_literals():
+    source = "// comment\n  let s = `a\n    b`;\n\n  call();\n"
+    assert build_assets.minify_js(source) == "let s = `a\n    b`;\ncall();\n"
+
+def test_build_writes_fingerprinted_and_compressed_files(built_assets):
+    dist_dir, manifest = built_assets
+    hashed_css = manifest["styles.css"]
+    assert hashed_css.startswith("styles.") and hashed_css.endswith(".css")
+    assert (dist_dir / hashed_css).read_text() == "body{color:red}"
+    assert gzip.decompress((dist_dir / (hashed_css + ".gz")).read_bytes()) == b"body{color:red}"
+    assert (dist_dir / "manifest.json").exists()
+
+def test_asset_url_uses_manifest(built_assets):
+    _, manifest = built_assets
+    with ems.app.test_request_context():
+        assert ems.asset_url("styles.css") == f"/assets/{manifest['styles.css']}"
+        assert ems.asset_url("missing.css") == "/static/missing.css"
+
+def test_serve_asset_precompressed(client, built_assets):
+    _, manifest = built_assets
+    response = client.get(f"/assets/{manifest['styles.css']}", headers={"Accept-Encoding": "gzip"})
+    assert response.status_code == 200
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert response.headers["Cache-Control"] == ems.ASSET_CACHE_CONTROL
+    assert response.mimetype == "text/css"
+    assert gzip.decompress(response.data) == b"body{color:red}"
+
+def test_serve_asset_uncompressed(client, built_assets):
+    _, manifest = built_assets
+    response = client.get(f"/assets/{manifest['styles.css']}", headers={"Accept-Encoding": "identity"})
+    assert response.status_code == 200
+    assert "Content-Encoding" not in response.headers
+    assert response.data == b"body{color:red}"
+
+def test_serve_asset_respects_refused_encoding(client, built_assets):
+    _, manifest = built_assets
+    response = client.get(f"/assets/{manifest['styles.css']}", headers={"Accept-Encoding": "br;q=0, gzip"})
+    assert response.status_code == 200
+    assert response.headers["Content-Encoding"] == "gzip"
+
+    response = client.get(f"/assets/{manifest['styles.css']}", headers={"Accept-Encoding": "br;q=0, gzip;q=0"})
+    assert "Content-Encoding" not in response.headers
+    assert response.data == b"body{color:red}"
+
+def test_serve_asset_only_serves_fingerprinted_files(client, built_assets):
+    assert client.get("/assets/manifest.json").status_code == 404
+    assert client.get("/assets/styles.css").status_code == 404
+
+def test_minify_css_leaves_strings_and_urls_alone():
+    source = 'a::after {\n    content: "a  b" ;\n}\nb > c { content: " > "; background: url( x  y.png ) }'
+    assert build_assets.minify_css(source) == 'a::after{content:"a  b"}b>c{content:" > ";background:url( x  y.png )}'
+
+def test_build_fails_on_missing_asset(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        build_assets.build(str(tmp_path), str(tmp_path / "dist"), ["missing.js"])
+
+def test_vendored_chart_js_matches_pinned_hash():
+    for filename, (_, expected_sha256) in build_assets.VENDOR_SOURCES.items():
+        with open(os.path.join(build_assets.STATIC_DIR, filename), "rb") as f:
+            assert hashlib.sha256(f.read()).hexdigest() == expected_sha256
+
+def test_fetch_vendor_files_rejects_hash_mismatch(tmp_path, monkeypatch):
+    class FakeResponse:
+        def read(self):
+            return b"tampered"
+        def __enter__(self):
+            return self
+        def __exit__(self, *args):
+            pass
+
+    monkeypatch.setattr(build_assets, "STATIC_DIR", str(tmp_path))
+    monkeypatch.setattr(build_assets, "VENDOR_SOURCES", {"vendor/lib.js": ("https://example.com/lib.js", "0" * 64)})
+    monkeypatch.setattr(build_assets.urllib.request, "urlopen", lambda url: FakeResponse())
+    with pytest.raises(SystemExit):
+        build_assets.fetch_vendor_files()
+    assert not (tmp_path / "vendor" / "lib.js").exists()
@@ -0,0 +1,125 @@
+import pytest
+import sys
+import os
+import uuid
+
+# Add the project root to sys.path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from sqlalchemy import event
+from app import app, MAX_BULK_IDS
+from models import db, Employee
+
+@pytest.fixture
+def database():
+    with app.app_context():
+        db.create_all()
+
+@pytest.fixture
+def client(database):
+    app.config['TESTING'] = True
+    with app.test_client() as client:
+        with client.session_transaction() as sess:
+            sess['username'] = "admin"
+            sess['is_admin'] = True
+        yield client
+
+@pytest.fixture
+def employee_ids(database):
+    with app.app_context():
+        employees = [
+            Employee(
+                first_name="Test",
+                last_name=f"Employee{i}",
+                email=f"{uuid.uuid4().hex}@example.com",
+                salary=1000.0,
+                title="Intern",
+            )
+            for i in range(3)
+        ]
+        db.session.add_all(employees)
+        db.session.commit()
+        ids = [emp.id for emp in employees]
+    yield ids
+    with app.app_context():
+        db.session.execute(db.delete(Employee).where(Employee.id.in_(ids)))
+        db.session.commit()
+
+@pytest.fixture
+def dml_statements():
+    """Collects the INSERT/UPDATE/DELETE statements sent to the database"""
+    statements = []
+    with app.app_context():
+        engine = db.engine
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if statement.split(None, 1)[0].upper() in ("INSERT", "UPDATE", "DELETE"):
+            statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    yield statements
+    event.remove(engine, "before_cursor_execute", record)
+
+def get_employees(ids):
+    with app.app_context():
+        return Employee.query.filter(Employee.id.in_(ids)).order_by(Employee.id).all()
+
+def test_bulk_delete(client, employee_ids, dml_statements):
+    response = client.delete('/employees/bulk/remove', json={"ids": employee_ids[:2]})
+    assert response.status_code == 200
+    assert response.get_json()["deleted"] == 2
+    assert len(dml_statements) == 1
+    assert [emp.id for emp in get_employees(employee_ids)] == employee_ids[2:]
+
+def test_bulk_update_title_and_raise(client, employee_ids, dml_statements):
+    response = client.put('/employees/bulk/edit', json={
+        "ids": employee_ids[:2],
+        "title": "Engineer",
+        "salary_raise_percent": 10,
+    })
+    assert response.status_code == 200
+    assert response.get_json()["updated"] == 2
+    assert len(dml_statements) == 1
+
+    employees = get_employees(employee_ids)
+    assert [emp.title for emp in employees] == ["Engineer", "Engineer", "Intern"]
+    assert [emp.salary for emp in employees] == pytest.approx([1100.0, 1100.0, 1000.0])
+
+@pytest.mark.parametrize("payload", [
+    {},
+    {"ids": []},
+    {"ids": ["1"]},
+    {"ids": [1]},
+    {"ids": [1], "title": "  "},
+    {"ids": [1], "title": {"a": 1}},
+    {"ids": [1], "title": 123},
+    {"ids": [1], "title": "x" * 51},
+    {"ids": [1], "salary_raise_percent": "abc"},
+    {"ids": [1], "salary_raise_percent": ""},
+    {"ids": [1], "salary_raise_percent": "5"},
+    {"ids": [1], "salary_raise_percent": True},
+    {"ids": [1], "salary_raise_percent": -100},
+])
+def test_bulk_update_rejects_invalid_payload(client, payload):
+    response = client.put('/employees/bulk/edit', json=payload)
+    assert response.status_code == 400
+
+def test_bulk_requests_are_capped(client):
+    ids = list(range(1, MAX_BULK_IDS + 2))
+    assert client.delete('/employees/bulk/remove', json={"ids": ids}).status_code == 400
+    assert client.put('/employees/bulk/edit', json={"ids": ids, "title": "Engineer"}).status_code == 400
+
+@pytest.mark.parametrize("method, url, payload", [
+    ("delete", '/employees/bulk/remove', {"ids": [1]}),
+    ("put", '/employees/bulk/edit', {"ids": [1], "title": "Engineer"}),
+])
+def test_bulk_database_errors_return_500(client, monkeypatch, method, url, payload):
+    def fail(*args, **kwargs):
+        raise RuntimeError("database is down")
+    monkeypatch.setattr(db.session, "execute", fail)
+    response = getattr(client, method)(url, json=payload)
+    assert response.status_code == 500
+
+def test_bulk_endpoints_require_login():
+    with app.test_client() as client:
+        assert client.delete('/employees/bulk/remove', json={"ids": [1]}).status_code == 401
+        assert client.put('/employees/bulk/edit', json={"ids": [1], "title": "x"}).status_code == 401
@@ -5,10 +5,13 @@ import os
 # Add the project root to sys.path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 from app import app 
+from models import db, Employee
 
 @pytest.fixture
 def client():
     app.config['TESTING'] = True
+    with app.app_context():
+        db.create_all()
     with app.test_client() as client:
         yield client
 
@@ -25,4 +28,18 @@ def test_login_page(client):
 def test_register_page(client):
     response = client.get('/register')
     assert response.status_code == 200
-    assert b"Register" in response.data
\ No newline at end of file
+    assert b"Register" in response.data
+def test_employee_login_is_case_insensitive(client):
+    with app.app_context():
+        employee = Employee(first_name="Jane", last_name="Doe", email="jane.login@example.com", username="JaneLogin")
+        employee.set_password("password123")
+        db.session.add(employee)
+        db.session.commit()
+    try:
+        response = client.post('/employee/login', data={"username": "janelogin", "password": "password123"})
+        assert response.status_code == 302
+        assert response.headers["Location"].endswith("/employee/dashboard")
+    finally:
+        with app.app_context():
+            db.session.execute(db.delete(Employee).where(Employee.email == "jane.login@example.com"))
+            db.session.commit()